@@ -103,8 +103,11 @@ const handler = async (
     const key = process.env.ENCRYPTION_KEY as string;
     const { recordId, producer, status, consent, data, updaterDid } = updateData;
 
+    // Serialize the data once for both encryption and hashing
+    const serializedData = JSON.stringify(data);
+
     // Encrypt the data
-    const encryptedData = encrypt(JSON.stringify(data), toCipherKey(key));
+    const encryptedData = encrypt(serializedData, toCipherKey(key));
 
     // Upload to IPFS and get the CID
     const res = await uploadToIPFS({
@@ -119,7 +122,7 @@ const handler = async (
     });
 
     // Get the hash of the data
-    const hash = await hashHex(JSON.stringify(data));
+    const hash = await hashHex(serializedData);
 
     // Calculate the signature
     const signature = await wallet.signMessage(hash);
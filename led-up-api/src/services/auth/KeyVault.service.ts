@@ -14,6 +14,14 @@ import { SecretClient } from '@azure/keyvault-secrets';
 
 import { keyVaultConfig } from '../../config/keyVault.config';
 
+/**
+ * Credential shared by all KeyVaultService instances.
+ *
+ * The credential caches its access token and only refreshes it shortly before expiry, so reusing a
+ * single instance avoids an Azure AD token request for every service created per invocation.
+ */
+let sharedCredential: DefaultAzureCredential | undefined;
+
 /**
  * KeyVaultService provides secure key management using Azure Key Vault
  */
@@ -31,7 +39,10 @@ export class KeyVaultService {
     }
 
     // Use DefaultAzureCredential which supports multiple authentication methods
-    this.credential = new DefaultAzureCredential();
+    if (!sharedCredential) {
+      sharedCredential = new DefaultAzureCredential();
+    }
+    this.credential = sharedCredential;
 
     // Initialize Key and Secret clients
     this.keyClient = new KeyClient(keyVaultConfig.vaultUrl, this.credential);
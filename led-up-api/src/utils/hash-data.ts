@@ -1,16 +1,29 @@
-import { BinaryLike, createHash } from 'crypto';
+import { BinaryLike, BinaryToTextEncoding, createHash, hash } from 'crypto';
 
 /**
- * Hashes a given string using the SHA-256 algorithm and returns the result in binary format.
+ * Computes the SHA-256 digest of a string or byte buffer in the given encoding.
  *
- * This function takes a string, computes its SHA-256 hash, and returns the resulting hash in binary format.
+ * Resolved once at module load: uses the one-shot `crypto.hash` when the runtime provides it
+ * (Node.js >= 20.12), which avoids allocating a `Hash` object per call, and falls back to
+ * `createHash` on older runtimes.
+ */
+const sha256: (data: BinaryLike, encoding: BinaryToTextEncoding) => string =
+  typeof hash === 'function'
+    ? (data, encoding) => hash('sha256', data, encoding)
+    : (data, encoding) => createHash('sha256').update(data).digest(encoding);
+
+/**
+ * Hashes given data using the SHA-256 algorithm and returns the result in binary format.
+ *
+ * This function takes a string or byte buffer, computes its SHA-256 hash, and returns the resulting hash in binary format.
+ * Strings are hashed as UTF-8; buffers are hashed as-is without an extra encoding pass.
  * The SHA-256 algorithm is commonly used for data integrity and cryptographic purposes.
  *
- * @param {string} data - The data to be hashed, provided as a string.
+ * @param {BinaryLike} data - The data to be hashed, provided as a string or byte buffer.
  *
  * @returns {Promise<BinaryLike>} A promise that resolves with the hashed data in binary format.
  *
- * @throws Will throw an error if hashing fails.
+ * @throws {TypeError} Rejects if the data is not a string or byte buffer.
  *
  * @example
  * const data = "Sensitive information";
@@ -18,25 +31,21 @@ import { BinaryLike, createHash } from 'crypto';
  *   .then(hash => console.log(hash))
  *   .catch(error => console.error('Failed to hash data:', error));
  */
-export const hashData = async (data: string): Promise<BinaryLike> => {
-  try {
-    return createHash('sha256').update(data).digest('binary');
-  } catch (error: any) {
-    throw new Error(`Failed to hash data: ${error.message}`);
-  }
+export const hashData = async (data: BinaryLike): Promise<BinaryLike> => {
+  return sha256(data, 'binary');
 };
 
 /**
- * Hashes a given string using the SHA-256 algorithm and returns the result in hexadecimal format.
+ * Hashes given data using the SHA-256 algorithm and returns the result in hexadecimal format.
  *
- * This function computes the SHA-256 hash of the input string and returns the result as a hexadecimal string,
+ * This function computes the SHA-256 hash of the input string or byte buffer and returns the result as a hexadecimal string,
  * which is useful for displaying or storing hashes in a human-readable format.
  *
- * @param {string} data - The data to be hashed, provided as a string.
+ * @param {BinaryLike} data - The data to be hashed, provided as a string or byte buffer.
  *
  * @returns {Promise<string>} A promise that resolves with the hashed data in hexadecimal format.
  *
- * @throws Will throw an error if hashing fails.
+ * @throws {TypeError} Rejects if the data is not a string or byte buffer.
  *
  * @example
  * const data = "Sensitive information";
@@ -44,10 +53,6 @@ export const hashData = async (data: string): Promise<BinaryLike> => {
  *   .then(hash => console.log(hash)) // Output: "hexadecimalHashString"
  *   .catch(error => console.error('Failed to hash data:', error));
  */
-export const hashHex = async (data: string): Promise<string> => {
-  try {
-    return createHash('sha256').update(data).digest('hex');
-  } catch (error: any) {
-    throw new Error(`Failed to hash data: ${error.message}`);
-  }
+export const hashHex = async (data: BinaryLike): Promise<string> => {
+  return sha256(data, 'hex');
 };
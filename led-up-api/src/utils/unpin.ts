@@ -26,6 +26,14 @@ const wait = (milliseconds: number) => {
  *   .catch(error => console.error('Fetching pins failed:', error));
  */
 export const fetchPins = async () => {
+  // Shared client so every page request carries the same Pinata headers
+  const client = axios.create({
+    headers: {
+      accept: 'application/json',
+      Authorization: `Bearer ${PINATA_JWT}`,
+    },
+  });
+
   try {
     console.log('Fetching pins...');
     const pinHashes = [];
@@ -34,13 +42,13 @@ export const fetchPins = async () => {
 
     while (hasMore === true) {
       try {
-        const response = await axios.get(`${PIN_QUERY}&pageOffset=${pageOffset}`, {
-          headers: {
-            accept: 'application/json',
-            Authorization: `Bearer ${PINATA_JWT}`,
-          },
-        });
-        const responseData = await response.data();
+        // Start the throttle window together with the request so the page
+        // round-trip overlaps the delay instead of adding to it
+        const [response] = await Promise.all([
+          client.get(`${PIN_QUERY}&pageOffset=${pageOffset}`),
+          wait(300),
+        ]);
+        const responseData = response.data;
         const rows = responseData.rows;
 
         if (rows.length === 0) {
@@ -49,7 +57,6 @@ export const fetchPins = async () => {
         const itemsReturned = rows.length;
         pinHashes.push(...rows.map((row: any) => row.ipfs_pin_hash));
         pageOffset += itemsReturned;
-        await wait(300);
       } catch (error) {
         console.log(error);
         break;
@@ -0,0 +1,47 @@
+import { DefaultAzureCredential } from '@azure/identity';
+import { KeyClient } from '@azure/keyvault-keys';
+import { SecretClient } from '@azure/keyvault-secrets';
+
+import { KeyVaultService } from '../../../src/services/auth/KeyVault.service';
+
+jest.mock('@azure/identity', () => ({
+  DefaultAzureCredential: jest.fn(),
+}));
+
+jest.mock('@azure/keyvault-keys', () => ({
+  KeyClient: jest.fn(),
+}));
+
+jest.mock('@azure/keyvault-secrets', () => ({
+  SecretClient: jest.fn(),
+}));
+
+jest.mock('../../../src/config/keyVault.config', () => ({
+  keyVaultConfig: {
+    vaultUrl: 'https://test-vault.vault.azure.net/',
+    keyPrefix: 'data-key-',
+    secretPrefix: 'encryption-secret-',
+  },
+}));
+
+describe('KeyVaultService', () => {
+  describe('Credential Sharing', () => {
+    it('should create a single credential shared by every instance', () => {
+      new KeyVaultService();
+      new KeyVaultService();
+
+      expect(DefaultAzureCredential).toHaveBeenCalledTimes(1);
+      const credential = (DefaultAzureCredential as unknown as jest.Mock).mock.instances[0];
+
+      // Both instances should hand the same credential to their Key and Secret clients
+      const keyClientCalls = (KeyClient as unknown as jest.Mock).mock.calls;
+      const secretClientCalls = (SecretClient as unknown as jest.Mock).mock.calls;
+      expect(keyClientCalls).toHaveLength(2);
+      expect(secretClientCalls).toHaveLength(2);
+      for (const [vaultUrl, clientCredential] of [...keyClientCalls, ...secretClientCalls]) {
+        expect(vaultUrl).toEqual('https://test-vault.vault.azure.net/');
+        expect(clientCredential).toBe(credential);
+      }
+    });
+  });
+});
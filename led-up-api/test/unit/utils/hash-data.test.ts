@@ -0,0 +1,65 @@
+import { createHash } from 'crypto';
+
+import { hashData, hashHex } from '../../../src/utils/hash-data';
+
+describe('hash-data', () => {
+  const data = 'This is a test message for hashing';
+
+  describe('hashHex', () => {
+    it('should match the SHA-256 test vector', async () => {
+      const hash = await hashHex('abc');
+
+      expect(hash).toEqual('ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad');
+    });
+
+    it('should match createHash output', async () => {
+      const hash = await hashHex(data);
+
+      expect(hash).toEqual(createHash('sha256').update(data).digest('hex'));
+    });
+
+    it('should hash byte buffers the same as their UTF-8 string', async () => {
+      const text = 'Données de santé';
+
+      expect(await hashHex(Buffer.from(text, 'utf8'))).toEqual(await hashHex(text));
+    });
+
+    it('should reject non-binary input', async () => {
+      await expect(hashHex(undefined as any)).rejects.toThrow(TypeError);
+    });
+  });
+
+  describe('hashData', () => {
+    it('should return the binary digest', async () => {
+      const hash = await hashData(data);
+
+      expect(hash).toEqual(createHash('sha256').update(data).digest('binary'));
+    });
+  });
+
+  describe('createHash fallback', () => {
+    afterEach(() => {
+      jest.dontMock('crypto');
+    });
+
+    it('should use createHash when crypto.hash is unavailable', async () => {
+      const actualCrypto = jest.requireActual('crypto');
+      const createHashSpy = jest.fn(actualCrypto.createHash);
+      let fallback: typeof import('../../../src/utils/hash-data');
+
+      // Simulate a Node.js < 20.12 runtime, which has no one-shot crypto.hash
+      jest.isolateModules(() => {
+        jest.doMock('crypto', () => ({ ...actualCrypto, hash: undefined, createHash: createHashSpy }));
+        fallback = require('../../../src/utils/hash-data');
+      });
+
+      expect(await fallback.hashHex('abc')).toEqual(
+        'ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad'
+      );
+      expect(await fallback.hashData(data)).toEqual(
+        createHash('sha256').update(data).digest('binary')
+      );
+      expect(createHashSpy).toHaveBeenCalledWith('sha256');
+    });
+  });
+});
@@ -0,0 +1,90 @@
+import axios from 'axios';
+
+import { fetchPins } from '../../../src/utils/unpin';
+
+jest.mock('axios', () => ({
+  __esModule: true,
+  default: { create: jest.fn(), delete: jest.fn() },
+}));
+
+describe('fetchPins', () => {
+  const mockedCreate = axios.create as jest.Mock;
+  const pages = [
+    [{ ipfs_pin_hash: 'QmFirst' }, { ipfs_pin_hash: 'QmSecond' }],
+    [{ ipfs_pin_hash: 'QmThird' }],
+    [],
+  ];
+
+  let get: jest.Mock;
+  let requestTimes: number[];
+
+  beforeEach(() => {
+    jest.useFakeTimers({ now: 0 });
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+
+    requestTimes = [];
+    get = jest.fn().mockImplementation(async () => {
+      const page = pages[requestTimes.length];
+      requestTimes.push(Date.now());
+
+      // Simulate a 200 ms page round-trip
+      await new Promise(resolve => setTimeout(resolve, 200));
+      return { data: { rows: page } };
+    });
+    mockedCreate.mockReturnValue({ get });
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+    jest.restoreAllMocks();
+    mockedCreate.mockReset();
+  });
+
+  it('should collect the pins from every page', async () => {
+    const result = fetchPins();
+    await jest.runAllTimersAsync();
+
+    expect(await result).toEqual(['QmFirst', 'QmSecond', 'QmThird']);
+    expect(get).toHaveBeenCalledTimes(pages.length);
+    expect(get.mock.calls.map(([url]) => new URL(url).searchParams.get('pageOffset'))).toEqual([
+      '0',
+      '2',
+      '3',
+    ]);
+  });
+
+  it('should overlap each page round-trip with the 300 ms throttle window', async () => {
+    const result = fetchPins();
+    await jest.runAllTimersAsync();
+    await result;
+
+    // Requests start exactly 300 ms apart: the 200 ms round-trip is hidden inside the
+    // throttle window rather than added to it (which would give 500 ms spacing)
+    expect(requestTimes).toEqual([0, 300, 600]);
+  });
+
+  it('should fetch every page through one client with the Pinata headers', async () => {
+    const result = fetchPins();
+    await jest.runAllTimersAsync();
+    await result;
+
+    expect(mockedCreate).toHaveBeenCalledTimes(1);
+    expect(mockedCreate).toHaveBeenCalledWith({
+      headers: {
+        accept: 'application/json',
+        Authorization: expect.stringMatching(/^Bearer /),
+      },
+    });
+    expect(get).toHaveBeenCalledTimes(pages.length);
+  });
+
+  it('should stop paging when a page request fails', async () => {
+    get.mockRejectedValueOnce(new Error('Pinata unavailable'));
+
+    const result = fetchPins();
+    await jest.runAllTimersAsync();
+
+    expect(await result).toEqual([]);
+    expect(get).toHaveBeenCalledTimes(1);
+  });
+});